@@ -15,7 +15,18 @@ DATABASE_URL = (
     f"{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
 )
 
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+# Connection pool sizing; ~25 connections suits PostgreSQL at 100-500 concurrent clients.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "25"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "25"))
+DB_POOL_RECYCLE_SECONDS = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+
+engine = create_engine(
+    DATABASE_URL,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_pre_ping=True,  # Detect connections dropped by PostgreSQL idle timeouts
+    pool_recycle=DB_POOL_RECYCLE_SECONDS,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -26,3 +37,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_connection():
+    # Plain Core connection for read-only endpoints, skipping Session setup
+    with engine.connect() as connection:
+        yield connection
@@ -1,29 +1,48 @@
+import asyncio
+import atexit
 import logging
 import os
+import queue
 import sys
 import time
-from typing import List, Optional
+from array import array
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
 
-from fastapi import Depends, FastAPI, HTTPException, Query, Response, status, Request
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Query, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.routing import Match
+from sqlalchemy import select, update
 from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import Session
 
 # --- Prometheus client imports ---
 from prometheus_client import Counter, Histogram, Gauge, generate_latest
-from prometheus_client.core import CollectorRegistry
+from prometheus_client.core import CollectorRegistry, CounterMetricFamily
+from prometheus_client.registry import Collector
 from starlette.responses import PlainTextResponse # Required for /metrics endpoint
 
-from .db import Base, engine, get_db
-from .models import Customer
-from .schemas import CustomerCreate, CustomerResponse, CustomerUpdate
+from .db import Base, engine, get_connection, get_db
+from .models import Customer, customer_response_columns, customer_search_text
+from .schemas import CustomerCreate, CustomerPage, CustomerResponse, CustomerUpdate
 
 # --- Standard Logging Configuration ---
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(name)s - %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)],
+# Records are handed to a queue and written to stdout by a background listener thread,
+# keeping stream I/O off the request path.
+_log_queue = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler(sys.stdout)
+_log_stream_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(levelname)s - %(name)s - %(message)s")
 )
+_log_queue_handler = QueueHandler(_log_queue)
+_log_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+logging.basicConfig(level=logging.INFO, handlers=[_log_queue_handler])
+_log_listener = QueueListener(_log_queue, _log_stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Flush queued records on exit, including sys.exit
 logger = logging.getLogger(__name__)
 
 # Suppress noisy logs from third-party libraries for cleaner output
@@ -33,54 +52,112 @@ logging.getLogger("uvicorn.error").setLevel(logging.INFO)
 
 PRODUCT_SERVICE_URL = os.getenv("PRODUCT_SERVICE_URL", "http://localhost:8000")
 logger.info(
-    f"Order Service: Configured to communicate with Product Service at: {PRODUCT_SERVICE_URL}"
+    "Order Service: Configured to communicate with Product Service at: %s",
+    PRODUCT_SERVICE_URL,
 )
 
 
 # --- Prometheus Metrics Initialization ---
 # Create a custom registry specific to this application instance
+# Series carry no constant service label; Prometheus adds job/instance labels at scrape time
 registry = CollectorRegistry()
-APP_NAME = "customer_service" # Unique identifier for this service in metrics
+
+
+class CachedHttpCollector(Collector):
+    """
+    Request counter kept in flat per-series arrays, indexed by (method, endpoint, status_code).
+    Scrapes iterate the arrays directly instead of walking labelled child metrics.
+    Updates are made from the event loop thread only.
+    """
+
+    def __init__(self):
+        self._index = {}
+        self.methods = []
+        self.endpoints = []
+        self.status_codes = []
+        self.counts = array('Q')
+
+    def series(self, method: str, endpoint: str, status_code: int) -> int:
+        key = (method, endpoint, status_code)
+        idx = self._index.get(key)
+        if idx is None:
+            idx = self._index[key] = len(self.counts)
+            self.methods.append(method)
+            self.endpoints.append(endpoint)
+            self.status_codes.append(str(status_code))
+            self.counts.append(0)
+        return idx
+
+    def inc(self, idx: int):
+        self.counts[idx] += 1
+
+    def collect(self):
+        family = CounterMetricFamily(
+            'http_requests_total', 'Total HTTP requests processed by the application',
+            labels=['method', 'endpoint', 'status_code'],
+        )
+        for method, endpoint, status_code, count in zip(
+            self.methods, self.endpoints, self.status_codes, self.counts
+        ):
+            family.add_metric([method, endpoint, status_code], count)
+        yield family
+
+
+# Latency buckets sized for HTTP calls; fewer than the client default of 15 series per histogram
+HTTP_LATENCY_BUCKETS = (0.005, 0.025, 0.1, 0.25, 1.0, 5.0, float("inf"))
 
 # Define Prometheus metrics (Basic HTTP Metrics)
-REQUEST_COUNT = Counter(
-    'http_requests_total', 'Total HTTP requests processed by the application',
-    ['app_name', 'method', 'endpoint', 'status_code'], registry=registry
-)
+REQUEST_COUNT = CachedHttpCollector()
+registry.register(REQUEST_COUNT)
 REQUEST_DURATION = Histogram(
     'http_request_duration_seconds', 'HTTP request duration in seconds',
-    ['app_name', 'method', 'endpoint', 'status_code'], registry=registry
+    ['method', 'endpoint', 'status_code'], registry=registry,
+    buckets=HTTP_LATENCY_BUCKETS,
 )
 REQUESTS_IN_PROGRESS = Gauge(
     'http_requests_in_progress', 'Number of HTTP requests in progress',
-    ['app_name', 'method', 'endpoint'], registry=registry
+    ['method', 'endpoint'], registry=registry
+)
+
+# Database connection pool metrics, read from engine.pool on each scrape since
+# engine.dispose() replaces the pool object
+DB_POOL_CHECKED_OUT = Gauge(
+    'db_pool_connections_checked_out', 'Database connections currently checked out of the pool',
+    registry=registry
+)
+DB_POOL_CHECKED_IN = Gauge(
+    'db_pool_connections_checked_in', 'Idle database connections currently held in the pool',
+    registry=registry
 )
+DB_POOL_CHECKED_OUT.set_function(lambda: engine.pool.checkedout())
+DB_POOL_CHECKED_IN.set_function(lambda: engine.pool.checkedin())
 
 # Custom Metrics specific to Order Service business logic
 ORDER_CREATION_TOTAL = Counter(
     'order_creation_total', 'Total number of orders created',
-    ['app_name', 'status'], registry=registry # status: success, failed_items, db_error
+    ['status'], registry=registry # status: success, failed_items, db_error
 )
 ORDER_ITEM_COUNT = Counter(
     'order_item_count', 'Total number of individual items processed in orders',
-    ['app_name', 'product_id'], registry=registry
+    registry=registry # Per-product breakdown belongs in logs, not labels
 )
 ORDER_TOTAL_AMOUNT = Histogram(
     'order_total_amount_dollars', 'Total amount of orders in dollars',
-    ['app_name'], registry=registry # This will provide buckets for order value distribution
+    registry=registry # This will provide buckets for order value distribution
 )
 ORDER_STATUS_UPDATE_TOTAL = Counter(
     'order_status_update_total', 'Total order status updates',
-    ['app_name', 'status'], registry=registry # status: success, not_found, db_error
+    ['status'], registry=registry # status: success, not_found, db_error
 )
 # Metrics for inter-service communication (calls from Order Service to Product Service)
 PRODUCT_SERVICE_CALL_TOTAL = Counter(
     'product_service_call_total', 'Total calls made from Order Service to Product Service',
-    ['app_name', 'target_endpoint', 'method', 'status_code'], registry=registry
+    ['target_endpoint', 'method', 'status_code'], registry=registry
 )
 PRODUCT_SERVICE_CALL_DURATION = Histogram(
     'product_service_call_duration_seconds', 'Duration of calls from Order Service to Product Service',
-    ['app_name', 'target_endpoint', 'method', 'status_code'], registry=registry
+    ['target_endpoint', 'method', 'status_code'], registry=registry,
+    buckets=HTTP_LATENCY_BUCKETS,
 )
 
 # --- FastAPI Application Setup ---
@@ -91,80 +168,157 @@ app = FastAPI(
 )
 
 # CORS
+# Comma-separated allow-list, e.g. "http://localhost:3000". Defaults to any origin.
+CORS_ORIGINS = [
+    origin.strip() for origin in os.getenv("CORS_ORIGINS", "*").split(",") if origin.strip()
+]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Restrict for production
-    allow_credentials=True,
+    allow_origins=CORS_ORIGINS,
+    # The frontend sends no cookies or auth headers; without credentials a wildcard origin
+    # is answered with a static "*" instead of echoing each Origin with Vary: Origin.
+    allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
 # --- Middleware for Prometheus Metrics ---
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    # Exclude the /metrics endpoint itself from being tracked
-    if request.url.path == "/metrics":
-        response = await call_next(request)
-        return response
-
-    method = request.method
-    endpoint = request.url.path
-
-    # Increment requests in progress
-    REQUESTS_IN_PROGRESS.labels(app_name=APP_NAME, method=method, endpoint=endpoint).inc()
-    start_time = time.time()
-    
-    response = await call_next(request) # Process the actual request
-
-    process_time = time.time() - start_time
-    status_code = response.status_code
-
-    # Decrement requests in progress
-    REQUESTS_IN_PROGRESS.labels(app_name=APP_NAME, method=method, endpoint=endpoint).dec()
-    # Increment total requests
-    REQUEST_COUNT.labels(app_name=APP_NAME, method=method, endpoint=endpoint, status_code=status_code).inc()
-    # Observe duration for request latency
-    REQUEST_DURATION.labels(app_name=APP_NAME, method=method, endpoint=endpoint, status_code=status_code).observe(process_time)
-
-    return response
+def _route_template(scope) -> str:
+    # Label by route template (e.g. /customers/{customer_id}) rather than the raw path,
+    # so metric cardinality is bounded by the number of routes, not by unique IDs.
+    partial = None
+    for route in scope["app"].router.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+        if match == Match.PARTIAL and partial is None:
+            partial = route.path  # Path matched but method did not (405)
+    return partial or "unmatched"
+
+
+def _code_class(status_code: int) -> str:
+    # Collapse status codes into 2xx/3xx/4xx/5xx for the histogram, which carries a
+    # series per bucket; the full code is kept on the cheaper request counter.
+    return f"{status_code // 100}xx"
+
+
+# Labelled metric children are memoized per label set; this is bounded because endpoints
+# are route templates rather than raw paths.
+@lru_cache(maxsize=4096)
+def _in_progress_child(method: str, endpoint: str):
+    return REQUESTS_IN_PROGRESS.labels(method=method, endpoint=endpoint)
+
+
+@lru_cache(maxsize=4096)
+def _completed_children(method: str, endpoint: str, status_code: int):
+    return (
+        REQUEST_COUNT.series(method, endpoint, status_code),
+        REQUEST_DURATION.labels(method=method, endpoint=endpoint, status_code=_code_class(status_code)),
+    )
+
+
+class PromMiddleware:
+    """
+    Pure ASGI middleware recording HTTP request metrics.
+    Avoids the extra task group and context copy of @app.middleware("http").
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        # Only HTTP requests are tracked; the /metrics endpoint itself is excluded
+        if scope["type"] != "http" or scope["path"] == "/metrics":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        endpoint = _route_template(scope)
+        status_code = 500  # Reported if the app fails before sending a response
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        # Increment requests in progress
+        in_progress = _in_progress_child(method, endpoint)
+        in_progress.inc()
+        start_time = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper) # Process the actual request
+        finally:
+            process_time = time.perf_counter() - start_time
+
+            # Decrement requests in progress
+            in_progress.dec()
+            count_series, request_duration = _completed_children(method, endpoint, status_code)
+            # Increment total requests
+            REQUEST_COUNT.inc(count_series)
+            # Observe duration for request latency
+            request_duration.observe(process_time)
+
+
+app.add_middleware(PromMiddleware)
 
 # --- Prometheus Metrics Endpoint ---
 # This is the endpoint Prometheus will scrape to collect metrics.
+# Serialized output is cached briefly so concurrent or closely spaced scrapes share one render.
+METRICS_CACHE_TTL_SECONDS = 5.0
+_metrics_cache = {"at": 0.0, "body": b""}
+_metrics_lock = asyncio.Lock()
+
+
 @app.get("/metrics", response_class=PlainTextResponse, summary="Prometheus metrics endpoint")
 async def metrics():
-    # generate_latest collects all metrics from the registry and formats them for Prometheus
-    return PlainTextResponse(generate_latest(registry))
+    async with _metrics_lock:
+        now = time.monotonic()
+        if not _metrics_cache["body"] or now - _metrics_cache["at"] >= METRICS_CACHE_TTL_SECONDS:
+            # generate_latest collects all metrics from the registry and formats them for Prometheus
+            _metrics_cache["body"] = generate_latest(registry)
+            _metrics_cache["at"] = now
+        return PlainTextResponse(_metrics_cache["body"])
 
 # --- FastAPI Event Handlers ---
 @app.on_event("startup")
 async def startup_event():
     max_retries = 10
-    retry_delay_seconds = 5
+    base_delay_seconds = 1
+    max_delay_seconds = 30
+    loop = asyncio.get_running_loop()
     for i in range(max_retries):
         try:
             logger.info(
-                f"Customer Service: Attempting to connect to PostgreSQL and create tables (attempt {i+1}/{max_retries})..."
+                "Customer Service: Attempting to connect to PostgreSQL and create tables (attempt %s/%s)...",
+                i + 1,
+                max_retries,
             )
-            Base.metadata.create_all(bind=engine)
+            # create_all blocks on the database, so run it off the event loop
+            await loop.run_in_executor(None, Base.metadata.create_all, engine)
             logger.info(
                 "Customer Service: Successfully connected to PostgreSQL and ensured tables exist."
             )
             break  # Exit loop if successful
         except OperationalError as e:
-            logger.warning(f"Customer Service: Failed to connect to PostgreSQL: {e}")
+            logger.warning("Customer Service: Failed to connect to PostgreSQL: %s", e)
             if i < max_retries - 1:
+                retry_delay_seconds = min(max_delay_seconds, base_delay_seconds * 2**i)
                 logger.info(
-                    f"Customer Service: Retrying in {retry_delay_seconds} seconds..."
+                    "Customer Service: Retrying in %s seconds...",
+                    retry_delay_seconds,
                 )
-                time.sleep(retry_delay_seconds)
+                await asyncio.sleep(retry_delay_seconds)
             else:
                 logger.critical(
-                    f"Customer Service: Failed to connect to PostgreSQL after {max_retries} attempts. Exiting application."
+                    "Customer Service: Failed to connect to PostgreSQL after %s attempts. Exiting application.",
+                    max_retries,
                 )
                 sys.exit(1)  # Critical failure: exit if DB connection is unavailable
         except Exception as e:
             logger.critical(
-                f"Customer Service: An unexpected error occurred during database startup: {e}",
+                "Customer Service: An unexpected error occurred during database startup: %s",
+                e,
                 exc_info=True,
             )
             sys.exit(1)
@@ -190,7 +344,7 @@ async def health_check():
     summary="Create a new customer",
 )
 async def create_customer(customer: CustomerCreate, db: Session = Depends(get_db)):
-    logger.info(f"Customer Service: Creating customer with email: {customer.email}")
+    logger.info("Customer Service: Creating customer with email: %s", customer.email)
     db_customer = Customer(
         email=customer.email,
         password_hash=customer.password,  # Storing raw password for simplicity in this example
@@ -202,23 +356,28 @@ async def create_customer(customer: CustomerCreate, db: Session = Depends(get_db
 
     try:
         db.add(db_customer)
+        db.flush()  # INSERT ... RETURNING populates the generated columns
+        # Build the response before commit expires the instance, avoiding a reload
+        created = CustomerResponse.model_validate(db_customer)
         db.commit()
-        db.refresh(db_customer)
         logger.info(
-            f"Customer Service: Customer '{db_customer.email}' (ID: {db_customer.customer_id}) created successfully."
+            "Customer Service: Customer '%s' (ID: %s) created successfully.",
+            created.email,
+            created.customer_id,
         )
-        return db_customer
+        return created
     except IntegrityError:
         db.rollback()
         logger.warning(
-            f"Customer Service: Attempted to create customer with existing email: {customer.email}"
+            "Customer Service: Attempted to create customer with existing email: %s",
+            customer.email,
         )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered."
         )
     except Exception as e:
         db.rollback()
-        logger.error(f"Customer Service: Error creating customer: {e}", exc_info=True)
+        logger.error("Customer Service: Error creating customer: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Could not create customer.",
@@ -227,33 +386,50 @@ async def create_customer(customer: CustomerCreate, db: Session = Depends(get_db
 
 @app.get(
     "/customers/",
-    response_model=List[CustomerResponse],
-    summary="Retrieve a list of all customers",
+    response_model=None,  # Rows are returned as plain dicts, skipping per-row validation
+    responses={status.HTTP_200_OK: {"model": CustomerPage}},
+    summary="Retrieve a page of customers",
 )
 def list_customers(
-    db: Session = Depends(get_db),
-    skip: int = Query(0, ge=0),
+    conn: Connection = Depends(get_connection),
+    after_id: Optional[int] = Query(None, ge=0),
     limit: int = Query(100, ge=1, le=100),
     search: Optional[str] = Query(None, max_length=255),
 ):
+    """
+    Lists customers ordered by ID using keyset pagination.
+    Pass the returned next_cursor as after_id to fetch the following page.
+    """
     logger.info(
-        f"Customer Service: Listing customers with skip={skip}, limit={limit}, search='{search}'"
+        "Customer Service: Listing customers with after_id=%s, limit=%s, search='%s'",
+        after_id,
+        limit,
+        search,
     )
-    query = db.query(Customer)
+    # Select only the response columns as plain rows, skipping ORM instantiation
+    query = select(*customer_response_columns).order_by(Customer.customer_id)
+    if after_id is not None:
+        # Seek on the primary key index instead of scanning and discarding OFFSET rows
+        query = query.where(Customer.customer_id > after_id)
     if search:
         search_pattern = f"%{search}%"
-        logger.info(f"Customer Service: Applying search filter for term: {search}")
-        query = query.filter(
-            (Customer.first_name.ilike(search_pattern))
-            | (Customer.last_name.ilike(search_pattern))
-            | (Customer.email.ilike(search_pattern))
-        )
-    customers = query.offset(skip).limit(limit).all()
+        logger.info("Customer Service: Applying search filter for term: %s", search)
+        # Single expression backed by the customers_search_trgm GIN index
+        query = query.where(customer_search_text.ilike(search_pattern))
+    customers = [dict(row) for row in conn.execute(query.limit(limit)).mappings()]
 
     logger.info(
-        f"Customer Service: Retrieved {len(customers)} customers (skip={skip}, limit={limit})."
+        "Customer Service: Retrieved %s customers (after_id=%s, limit=%s).",
+        len(customers),
+        after_id,
+        limit,
     )
-    return customers
+    # Encode the plain rows with orjson directly, bypassing jsonable_encoder
+    payload = {
+        "items": customers,
+        "next_cursor": customers[-1]["customer_id"] if customers else None,
+    }
+    return Response(orjson.dumps(payload), media_type="application/json")
 
 
 @app.get(
@@ -261,20 +437,30 @@ def list_customers(
     response_model=CustomerResponse,
     summary="Retrieve a single customer by ID",
 )
-def get_customer(customer_id: int, db: Session = Depends(get_db)):
+def get_customer(customer_id: int, conn: Connection = Depends(get_connection)):
     """
     Retrieves details for a specific customer using their unique ID.
     """
-    logger.info(f"Customer Service: Fetching customer with ID: {customer_id}")
-    customer = db.query(Customer).filter(Customer.customer_id == customer_id).first()
+    logger.info("Customer Service: Fetching customer with ID: %s", customer_id)
+    customer = (
+        conn.execute(
+            select(*customer_response_columns).where(
+                Customer.customer_id == customer_id
+            )
+        )
+        .mappings()
+        .first()
+    )
     if not customer:
-        logger.warning(f"Customer Service: Customer with ID {customer_id} not found.")
+        logger.warning("Customer Service: Customer with ID %s not found.", customer_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Customer not found"
         )
 
     logger.info(
-        f"Customer Service: Retrieved customer with ID {customer_id}. Email: {customer.email}"
+        "Customer Service: Retrieved customer with ID %s. Email: %s",
+        customer_id,
+        customer["email"],
     )
     return customer
 
@@ -291,40 +477,48 @@ async def update_customer(
     Updates an existing customer's details. Only provided fields will be updated.
     Does not allow password update via this endpoint for security (use a dedicated endpoint if needed).
     """
+    update_data = customer_data.model_dump(exclude_unset=True)
     logger.info(
-        f"Customer Service: Updating customer with ID: {customer_id} with data: {customer_data.model_dump(exclude_unset=True)}"
+        "Customer Service: Updating customer with ID: %s with data: %s",
+        customer_id,
+        update_data,
     )
-    db_customer = db.query(Customer).filter(Customer.customer_id == customer_id).first()
-    if not db_customer:
-        logger.warning(
-            f"Customer Service: Attempted to update non-existent customer with ID {customer_id}."
-        )
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Customer not found"
-        )
-
-    update_data = customer_data.model_dump(exclude_unset=True)
 
     if "password" in update_data:  # If 'password' was somehow passed, remove it
         logger.warning(
-            f"Customer Service: Attempted password update via general /customers/{{id}} endpoint for customer {customer_id}. This is disallowed."
+            "Customer Service: Attempted password update via general /customers/{id} endpoint for customer %s. This is disallowed.",
+            customer_id,
         )
         del update_data["password"]  # Remove password if present
 
-    for key, value in update_data.items():
-        setattr(db_customer, key, value)
+    if not update_data:  # Nothing to change; return the current record
+        db_customer = db.get(Customer, customer_id)
+        if not db_customer:
+            logger.warning(
+                "Customer Service: Attempted to update non-existent customer with ID %s.",
+                customer_id,
+            )
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Customer not found"
+            )
+        return db_customer
 
+    # Single UPDATE ... RETURNING round-trip instead of SELECT, UPDATE and refresh
+    stmt = (
+        update(Customer)
+        .where(Customer.customer_id == customer_id)
+        .values(**update_data)
+        .returning(*customer_response_columns)
+    )
     try:
-        db.add(db_customer)  # Mark for update
+        updated = db.execute(stmt).mappings().first()
         db.commit()
-        db.refresh(db_customer)
-        logger.info(f"Customer Service: Customer {customer_id} updated successfully.")
-        return db_customer
     except IntegrityError:
         db.rollback()
         # This could happen if a user tries to change email to one that already exists
         logger.warning(
-            f"Customer Service: Attempted to update customer {customer_id} to an existing email."
+            "Customer Service: Attempted to update customer %s to an existing email.",
+            customer_id,
         )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -333,7 +527,9 @@ async def update_customer(
     except Exception as e:
         db.rollback()
         logger.error(
-            f"Customer Service: Error updating customer {customer_id}: {e}",
+            "Customer Service: Error updating customer %s: %s",
+            customer_id,
+            e,
             exc_info=True,
         )
         raise HTTPException(
@@ -341,6 +537,18 @@ async def update_customer(
             detail="Could not update customer.",
         )
 
+    if updated is None:
+        logger.warning(
+            "Customer Service: Attempted to update non-existent customer with ID %s.",
+            customer_id,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Customer not found"
+        )
+
+    logger.info("Customer Service: Customer %s updated successfully.", customer_id)
+    return dict(updated)
+
 
 @app.delete(
     "/customers/{customer_id}",
@@ -352,12 +560,14 @@ def delete_customer(customer_id: int, db: Session = Depends(get_db)):
     Deletes a customer record from the database.
     """
     logger.info(
-        f"Customer Service: Attempting to delete customer with ID: {customer_id}"
+        "Customer Service: Attempting to delete customer with ID: %s",
+        customer_id,
     )
-    customer = db.query(Customer).filter(Customer.customer_id == customer_id).first()
+    customer = db.get(Customer, customer_id)
     if not customer:
         logger.warning(
-            f"Customer Service: Attempted to delete non-existent customer with ID {customer_id}."
+            "Customer Service: Attempted to delete non-existent customer with ID %s.",
+            customer_id,
         )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Customer not found"
@@ -367,12 +577,16 @@ def delete_customer(customer_id: int, db: Session = Depends(get_db)):
         db.delete(customer)
         db.commit()
         logger.info(
-            f"Customer Service: Customer {customer_id} deleted successfully. Email: {customer.email}"
+            "Customer Service: Customer %s deleted successfully. Email: %s",
+            customer_id,
+            customer.email,
         )
     except Exception as e:
         db.rollback()
         logger.error(
-            f"Customer Service: Error deleting customer {customer_id}: {e}",
+            "Customer Service: Error deleting customer %s: %s",
+            customer_id,
+            e,
             exc_info=True,
         )
         raise HTTPException(
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DateTime, Integer, String
+from sqlalchemy import DDL, Column, DateTime, Index, Integer, String, event, literal_column
 from sqlalchemy.sql import func  # For auto-populating timestamps
 
 from .db import Base
@@ -17,8 +17,43 @@ class Customer(Base):
     created_at = Column(DateTime, default=func.now(), nullable=False)
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
+    # Fetch server-generated values (ID, timestamps) via INSERT ... RETURNING
+    # instead of a follow-up SELECT.
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self):
         """
         String representation of the Customer object, useful for debugging.
         """
         return f"<Customer(id={self.customer_id}, email='{self.email}', name='{self.first_name} {self.last_name}')>"
+
+
+# Columns returned by the API (everything except password_hash), resolved once at import
+# for the Core select and UPDATE ... RETURNING statements.
+customer_response_columns = tuple(
+    column for column in Customer.__table__.columns if column.name != "password_hash"
+)
+
+# Searchable text for a customer. list_customers must filter on this exact expression
+# so PostgreSQL can serve leading-wildcard ILIKE from the trigram index below.
+customer_search_text = (
+    Customer.first_name
+    + literal_column("' '")
+    + Customer.last_name
+    + literal_column("' '")
+    + Customer.email
+)
+
+Index(
+    "customers_search_trgm",
+    customer_search_text.label("search_text"),
+    postgresql_using="gin",
+    postgresql_ops={"search_text": "gin_trgm_ops"},
+)
+
+# The trigram operator class must exist before the index is created
+event.listen(
+    Customer.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
@@ -53,3 +53,12 @@ class CustomerResponse(CustomerBase):
     )
 
     model_config = ConfigDict(from_attributes=True)  # Enable ORM mode for Pydantic V2
+
+
+# Schema for a keyset-paginated page of customers
+class CustomerPage(BaseModel):
+    items: List[CustomerResponse] = Field(..., description="Customers in this page.")
+    next_cursor: Optional[int] = Field(
+        None,
+        description="Pass as after_id to fetch the next page; null when the page is empty.",
+    )
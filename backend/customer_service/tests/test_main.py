@@ -2,8 +2,8 @@ import logging
 import time
 
 import pytest
-from app.db import Base, SessionLocal, engine, get_db
-from app.main import app
+from app.db import Base, SessionLocal, engine, get_connection, get_db
+from app.main import _metrics_cache, app
 from app.models import Customer
 
 from fastapi.testclient import TestClient
@@ -67,7 +67,11 @@ def db_session_for_test():
     def override_get_db():
         yield db
 
+    def override_get_connection():
+        yield connection
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_connection] = override_get_connection
 
     try:
         yield db
@@ -76,6 +80,14 @@ def db_session_for_test():
         db.close()
         connection.close()
         app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_connection, None)
+
+
+@pytest.fixture(scope="function")
+def fresh_metrics():
+    # /metrics output is cached briefly; expire it so assertions see current values
+    _metrics_cache["at"] = 0.0
+    _metrics_cache["body"] = b""
 
 
 @pytest.fixture(scope="module")
@@ -157,7 +169,32 @@ def test_list_customers_empty(client: TestClient, db_session_for_test: Session):
     """Tests listing customers when none exist."""
     response = client.get("/customers/")
     assert response.status_code == 200
-    assert response.json() == []
+    assert response.json() == {"items": [], "next_cursor": None}
+
+
+def test_list_customers_keyset_pagination(
+    client: TestClient, db_session_for_test: Session
+):
+    """Tests paging through customers with the after_id cursor."""
+    for i in range(3):
+        client.post(
+            "/customers/",
+            json={
+                "email": f"page{i}@example.com",
+                "password": "pagepassword",
+                "first_name": "Page",
+                "last_name": f"User{i}",
+            },
+        )
+
+    first_page = client.get("/customers/", params={"limit": 2}).json()
+    assert len(first_page["items"]) == 2
+    assert first_page["next_cursor"] == first_page["items"][-1]["customer_id"]
+
+    second_page = client.get(
+        "/customers/", params={"limit": 2, "after_id": first_page["next_cursor"]}
+    ).json()
+    assert [c["email"] for c in second_page["items"]] == ["page2@example.com"]
 
 
 def test_update_customer_success(client: TestClient, db_session_for_test: Session):
@@ -192,6 +229,24 @@ def test_update_customer_success(client: TestClient, db_session_for_test: Sessio
     assert db_customer.shipping_address == "New Address Lane"
 
 
+def test_update_customer_empty_payload(
+    client: TestClient, db_session_for_test: Session
+):
+    """Tests that an update with no fields returns the customer unchanged."""
+    customer_data = {
+        "email": "unchanged@example.com",
+        "password": "samepassword",
+        "first_name": "Linus",
+        "last_name": "Torvalds",
+    }
+    create_response = client.post("/customers/", json=customer_data)
+    customer_id = create_response.json()["customer_id"]
+
+    response = client.put(f"/customers/{customer_id}", json={})
+    assert response.status_code == 200
+    assert response.json() == create_response.json()
+
+
 def test_update_customer_not_found(client: TestClient):
     """Tests updating a non-existent customer, expecting 404."""
     response = client.put("/customers/999999", json={"first_name": "NonExistent"})
@@ -230,3 +285,54 @@ def test_delete_customer_not_found(client: TestClient):
     response = client.delete("/customers/999999")
     assert response.status_code == 404
     assert response.json()["detail"] == "Customer not found"
+
+
+def test_metrics_label_route_template(client: TestClient, fresh_metrics):
+    """Tests that HTTP metrics are labelled by route template, not the raw path."""
+    client.get("/customers/424242")
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert 'endpoint="/customers/{customer_id}"' in response.text
+    assert 'endpoint="/customers/424242"' not in response.text
+
+
+def test_metrics_duration_uses_status_class(client: TestClient, fresh_metrics):
+    """Tests that the duration histogram groups status codes into classes."""
+    client.get("/health")
+    response = client.get("/metrics")
+    assert 'http_request_duration_seconds_count{endpoint="/health",method="GET",status_code="2xx"}' in response.text
+    assert 'http_requests_total{endpoint="/health",method="GET",status_code="200"}' in response.text
+
+
+def test_list_customers_search(client: TestClient, db_session_for_test: Session):
+    """Tests filtering customers by a search term across name and email."""
+    client.post(
+        "/customers/",
+        json={
+            "email": "searchable@example.com",
+            "password": "searchpassword",
+            "first_name": "Ada",
+            "last_name": "Lovelace",
+        },
+    )
+    client.post(
+        "/customers/",
+        json={
+            "email": "other@example.com",
+            "password": "otherpassword",
+            "first_name": "Alan",
+            "last_name": "Turing",
+        },
+    )
+
+    response = client.get("/customers/", params={"search": "lovel"})
+    assert response.status_code == 200
+    assert [c["email"] for c in response.json()["items"]] == ["searchable@example.com"]
+
+
+def test_metrics_output_is_cached(client: TestClient, fresh_metrics):
+    """Tests that scrapes within the cache TTL reuse the rendered output."""
+    first = client.get("/metrics").text
+    client.get("/health")
+    second = client.get("/metrics").text
+    assert first == second
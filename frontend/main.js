@@ -251,7 +251,7 @@ document.addEventListener('DOMContentLoaded', () => {
                 const errorData = await response.json();
                 throw new Error(errorData.detail || `HTTP error! status: ${response.status}`);
             }
-            const customers = await response.json();
+            const { items: customers } = await response.json();
             
             customerListDiv.innerHTML = ''; // Clear previous content
 